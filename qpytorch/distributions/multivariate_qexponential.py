@@ -169,7 +169,9 @@ class MultivariateQExponential(TMultivariateNormal, Distribution):
             new_scale_tril = self.__unbroadcasted_scale_tril.expand(
                 batch_size + self.__unbroadcasted_scale_tril.shape[-2:]
             )
-            super(MultivariateQExponential, new).__init__(loc=new_loc, scale_tril=new_scale_tril)
+            # The arguments were already validated when self was constructed.
+            super(MultivariateQExponential, new).__init__(loc=new_loc, scale_tril=new_scale_tril, validate_args=False)
+            new._validate_args = self._validate_args
             new.power = self.power
             # Set the covar matrix, since it is always available for QPyTorch QEP.
             new.covariance_matrix = self.covariance_matrix.expand(batch_size + self.covariance_matrix.shape[-2:])
@@ -207,7 +209,9 @@ class MultivariateQExponential(TMultivariateNormal, Distribution):
             new = self.__new__(type(self))
             new._islazy = False
             new_scale_tril = self.__unbroadcasted_scale_tril.unsqueeze(dim)
-            super(MultivariateQExponential, new).__init__(loc=new_loc, scale_tril=new_scale_tril)
+            # The arguments were already validated when self was constructed.
+            super(MultivariateQExponential, new).__init__(loc=new_loc, scale_tril=new_scale_tril, validate_args=False)
+            new._validate_args = self._validate_args
             new.power = self.power
             # Set the covar matrix, since it is always available for QPyTorch QEP.
             new.covariance_matrix = self.covariance_matrix.unsqueeze(dim)
@@ -489,7 +493,11 @@ class MultivariateQExponential(TMultivariateNormal, Distribution):
                 power=self.power
             )
         elif isinstance(other, int) or isinstance(other, float):
-            return self.__class__(self.mean + other, self.lazy_covariance_matrix, self.power)
+            new = self.__class__(self.mean + other, self.lazy_covariance_matrix, self.power)
+            if self.__unbroadcasted_scale_tril is not None:
+                # Shifting the mean leaves the scale tril unchanged, so reuse it if available.
+                new.__unbroadcasted_scale_tril = self.__unbroadcasted_scale_tril
+            return new
         else:
             raise RuntimeError("Unsupported type {} for addition w/ MultivariateQExponential".format(type(other)))
 
@@ -539,7 +547,11 @@ class MultivariateQExponential(TMultivariateNormal, Distribution):
             raise RuntimeError("Can only multiply by scalars")
         if other == 1:
             return self
-        return self.__class__(mean=self.mean * other, covariance_matrix=self.lazy_covariance_matrix * (other**2), power=self.power)
+        new = self.__class__(mean=self.mean * other, covariance_matrix=self.lazy_covariance_matrix * (other**2), power=self.power)
+        if self.__unbroadcasted_scale_tril is not None:
+            # Reuse the scale tril if available, rescaled so that its diagonal stays positive.
+            new.__unbroadcasted_scale_tril = self.__unbroadcasted_scale_tril * abs(other)
+        return new
 
     def __radd__(self, other: MultivariateQExponential) -> MultivariateQExponential:
         if other == 0:
@@ -142,6 +142,31 @@ class GridInterpolationKernel(GridKernel):
         interp_values = interp_values.view(*batch_shape, n_data, -1)
         return interp_indices, interp_values
 
+    def _compute_grid_cached(self, inputs, last_dim_is_batch=False):
+        # The interpolation weights only depend on the inputs and the grid. The training inputs are
+        # passed in as the same tensor on every iteration, so their weights are reused as long as the
+        # grid stays the same (a dynamic grid is rebuilt each call, but from the same inputs).
+        # Only training inputs are cached, so that the module never holds on to eval-time inputs, and
+        # inference tensors are skipped since they do not track a version counter.
+        if (
+            not self.training
+            or inputs.requires_grad
+            or inputs.is_inference()
+            or torch.is_inference_mode_enabled()
+        ):
+            return self._compute_grid(inputs, last_dim_is_batch)
+        cache = getattr(self, "_cached_interp", None)
+        if (
+            cache is not None
+            and cache[0] is inputs
+            and cache[1] == (inputs._version, last_dim_is_batch)
+            and all(torch.equal(grid, cached_grid) for grid, cached_grid in zip(self.grid, cache[2]))
+        ):
+            return cache[3]
+        res = self._compute_grid(inputs, last_dim_is_batch)
+        self._cached_interp = (inputs, (inputs._version, last_dim_is_batch), tuple(self.grid), res)
+        return res
+
     def _inducing_forward(self, last_dim_is_batch, **params):
         return super().forward(self.grid, self.grid, last_dim_is_batch=last_dim_is_batch, **params)
 
@@ -184,12 +209,12 @@ class GridInterpolationKernel(GridKernel):
         if last_dim_is_batch and base_lazy_tsr.size(-3) == 1:
             base_lazy_tsr = base_lazy_tsr.repeat(*x1.shape[:-2], x1.size(-1), 1, 1)
 
-        left_interp_indices, left_interp_values = self._compute_grid(x1, last_dim_is_batch)
+        left_interp_indices, left_interp_values = self._compute_grid_cached(x1, last_dim_is_batch)
         if torch.equal(x1, x2):
             right_interp_indices = left_interp_indices
             right_interp_values = left_interp_values
         else:
-            right_interp_indices, right_interp_values = self._compute_grid(x2, last_dim_is_batch)
+            right_interp_indices, right_interp_values = self._compute_grid_cached(x2, last_dim_is_batch)
 
         batch_shape = torch.broadcast_shapes(
             base_lazy_tsr.batch_shape,
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import torch
-from linear_operator.operators import KroneckerProductLinearOperator
 
 from gpytorch.kernels.rbf_kernel import postprocess_rbf, RBFKernel
 
@@ -57,69 +56,76 @@ class RBFKernelGrad(RBFKernel):
 
     def forward(self, x1, x2, diag=False, **params):
         batch_shape = x1.shape[:-2]
-        n_batch_dims = len(batch_shape)
         n1, d = x1.shape[-2:]
         n2 = x2.shape[-2]
 
         if not diag:
-            K = torch.zeros(*batch_shape, n1 * (d + 1), n2 * (d + 1), device=x1.device, dtype=x1.dtype)
+            # The blocks are written straight into an (n1, d+1, n2, d+1) layout,
+            # which flattens to the interleaved (MultiTask) ordering for free
+            K = x1.new_empty(*batch_shape, n1, d + 1, n2, d + 1)
 
             # Scale the inputs by the lengthscale (for stability)
             x1_ = x1.div(self.lengthscale)
             x2_ = x2.div(self.lengthscale)
 
             # Form all possible rank-1 products for the gradient and Hessian blocks
+            # shape of n1 x n2 x d, kept in this single layout: the blocks below only take views of it
             outer = x1_.view(*batch_shape, n1, 1, d) - x2_.view(*batch_shape, 1, n2, d)
-            outer = outer / self.lengthscale.unsqueeze(-2)
-            outer = torch.transpose(outer, -1, -2).contiguous()
+            outer.div_(self.lengthscale.unsqueeze(-2))
+
+            # When x1 == x2, K is symmetric. Symmetrizing K_11 (rather than all of K) is enough for stability,
+            # as long as every other block is formed so that it is exactly symmetric as well
+            # (check identity first to avoid a device sync on the elementwise comparison)
+            symmetric = x1 is x2 or (n1 == n2 and torch.equal(x1, x2))
 
             # 1) Kernel block
             diff = self.covar_dist(x1_, x2_, square_dist=True, **params)
             K_11 = postprocess_rbf(diff)
-            K[..., :n1, :n2] = K_11
+            if symmetric:
+                K_11 = 0.5 * (K_11 + K_11.transpose(-1, -2))
+            K[..., :, 0, :, 0] = K_11
 
             # 2) First gradient block
-            outer1 = outer.view(*batch_shape, n1, n2 * d)
-            K[..., :n1, n2:] = outer1 * K_11.repeat([*([1] * (n_batch_dims + 1)), d])
+            grad = outer * K_11.unsqueeze(-1)
+            K[..., :, 0, :, 1:] = grad
 
             # 3) Second gradient block
-            outer2 = outer.transpose(-1, -3).reshape(*batch_shape, n2, n1 * d)
-            outer2 = outer2.transpose(-1, -2)
-            K[..., n1:, :n2] = -outer2 * K_11.repeat([*([1] * n_batch_dims), d, 1])
+            neg_grad = -grad.transpose(-1, -2)
+            K[..., :, 1:, :, 0] = neg_grad
 
             # 4) Hessian block
-            outer3 = outer1.repeat([*([1] * n_batch_dims), d, 1]) * outer2.repeat([*([1] * (n_batch_dims + 1)), d])
-            kp = KroneckerProductLinearOperator(
-                torch.eye(d, d, device=x1.device, dtype=x1.dtype).repeat(*batch_shape, 1, 1) / self.lengthscale.pow(2),
-                torch.ones(n1, n2, device=x1.device, dtype=x1.dtype).repeat(*batch_shape, 1, 1),
+            if symmetric:
+                # -(outer_j * outer_i) * K_11 is unchanged (bitwise) by swapping (x1, j) with (x2, i)
+                outer3 = outer.transpose(-1, -2).unsqueeze(-1) * outer.unsqueeze(-3)
+                K[..., :, 1:, :, 1:] = (outer3 * K_11.unsqueeze(-2).unsqueeze(-1)).neg_()
+            else:
+                # -outer_j * outer_i * K_11 is formed in a single product, reusing the second gradient block
+                K[..., :, 1:, :, 1:] = neg_grad.unsqueeze(-1) * outer.unsqueeze(-3)
+            # the diagonal (in the input dimensions) also picks up K_11 / lengthscale^2,
+            # which is added in place rather than through an identity matrix
+            K[..., :, 1:, :, 1:].diagonal(dim1=-3, dim2=-1).add_(
+                K_11.unsqueeze(-1) / self.lengthscale.pow(2).unsqueeze(-2)
             )
-            chain_rule = kp.to_dense() - outer3
-            K[..., n1:, n2:] = chain_rule * K_11.repeat([*([1] * n_batch_dims), d, d])
-
-            # Symmetrize for stability
-            if n1 == n2 and torch.eq(x1, x2).all():
-                K = 0.5 * (K.transpose(-1, -2) + K)
 
-            # Apply a perfect shuffle permutation to match the MutiTask ordering
             if self._interleaved:
-                pi1 = torch.arange(n1 * (d + 1)).view(d + 1, n1).t().reshape((n1 * (d + 1)))
-                pi2 = torch.arange(n2 * (d + 1)).view(d + 1, n2).t().reshape((n2 * (d + 1)))
-                K = K[..., pi1, :][..., :, pi2]
+                K = K.reshape(*batch_shape, n1 * (d + 1), n2 * (d + 1))
+            else:
+                K = K.transpose(-4, -3).transpose(-2, -1).reshape(*batch_shape, n1 * (d + 1), n2 * (d + 1))
 
             return K
 
         else:
-            if not (n1 == n2 and torch.eq(x1, x2).all()):
+            if x1 is not x2 and not (n1 == n2 and torch.equal(x1, x2)):
                 raise RuntimeError("diag=True only works when x1 == x2")
 
-            kernel_diag = super(RBFKernelGrad, self).forward(x1, x2, diag=True)
             grad_diag = torch.ones(*batch_shape, n2, d, device=x1.device, dtype=x1.dtype) / self.lengthscale.pow(2)
-            grad_diag = grad_diag.transpose(-1, -2).reshape(*batch_shape, n2 * d)
+            # The RBF kernel between identical points is exp(0) = 1, so there is no need to evaluate it
+            kernel_diag = torch.ones_like(grad_diag[..., :1])
+            # shape of n2 x (d+1), which flattens to the interleaved ordering
             k_diag = torch.cat((kernel_diag, grad_diag), dim=-1)
-            if self._interleaved:
-                pi = torch.arange(n2 * (d + 1)).view(d + 1, n2).t().reshape((n2 * (d + 1)))
-                k_diag = k_diag[..., pi]
-            return k_diag
+            if not self._interleaved:
+                k_diag = k_diag.transpose(-1, -2)
+            return k_diag.reshape(*batch_shape, n2 * (d + 1))
 
     def num_outputs_per_input(self, x1, x2):
         return x1.size(-1) + 1
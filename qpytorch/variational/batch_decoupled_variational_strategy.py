@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
-from typing import Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 import torch
-from linear_operator.operators import LinearOperator, MatmulLinearOperator, SumLinearOperator
+from linear_operator.operators import DenseLinearOperator, LinearOperator, MatmulLinearOperator, SumLinearOperator
 from torch import Tensor
 from torch.distributions.kl import kl_divergence
 
+from .. import settings
 from ..distributions import Delta, MultivariateNormal, MultivariateQExponential
 from ..models import ApproximateGP, ApproximateQEP
+from gpytorch.settings import _linalg_dtype_cholesky
 from gpytorch.utils.errors import CachingError
 from gpytorch.utils.memoize import pop_from_cache_ignore_args
 from ._variational_distribution import _VariationalDistribution
@@ -16,6 +18,24 @@ from .delta_variational_distribution import DeltaVariationalDistribution
 from .variational_strategy import VariationalStrategy
 
 
+def _keep_one_set_of_shared_inducing_points(
+    state_dict: Dict[str, Tensor],
+    prefix: str,
+    local_metadata: Dict[str, Any],
+    strict: bool,
+    missing_keys: Iterable[str],
+    unexpected_keys: Iterable[str],
+    error_msgs: Iterable[str],
+):
+    # Older models stored two identical copies of fixed inducing points along the mean/var batch dimension
+    # Differing copies are left alone, so that loading them still fails with a size mismatch
+    key = prefix + "inducing_points"
+    inducing_points = state_dict.get(key)
+    if inducing_points is not None and inducing_points.dim() >= 3 and inducing_points.size(-3) == 2:
+        if torch.equal(inducing_points.select(-3, 0), inducing_points.select(-3, 1)):
+            state_dict[key] = inducing_points.narrow(-3, 0, 1)
+
+
 class BatchDecoupledVariationalStrategy(VariationalStrategy):
     r"""
     A VariationalStrategy that uses a different set of inducing points for the
@@ -160,13 +180,19 @@ class BatchDecoupledVariationalStrategy(VariationalStrategy):
 
         # We're going to create two set of inducing points
         # One set for computing the mean, one set for computing the variance
-        if self.mean_var_batch_dim is not None:
-            inducing_points = torch.stack([inducing_points, inducing_points], dim=(self.mean_var_batch_dim - 2))
+        # If the inducing points are fixed and the kernel hypers are shared, the two sets would stay identical,
+        # so we keep a single set with a singleton mean/var batch dimension instead
+        stack_dim = -3 if self.mean_var_batch_dim is None else (self.mean_var_batch_dim - 2)
+        self._share_mean_var = self.mean_var_batch_dim is None and not learn_inducing_locations
+        if self._share_mean_var:
+            inducing_points = inducing_points.unsqueeze(stack_dim)
         else:
-            inducing_points = torch.stack([inducing_points, inducing_points], dim=-3)
+            inducing_points = torch.stack([inducing_points, inducing_points], dim=stack_dim)
         super().__init__(
             model, inducing_points, variational_distribution, learn_inducing_locations, jitter_val=jitter_val
         )
+        if self._share_mean_var:
+            self._register_load_state_dict_pre_hook(_keep_one_set_of_shared_inducing_points)
 
     def _expand_inputs(self, x: Tensor, inducing_points: Tensor) -> Tuple[Tensor, Tensor]:
         # If we haven't explicitly marked a dimension as batch, add the corresponding batch dimension to the input
@@ -192,13 +218,15 @@ class BatchDecoupledVariationalStrategy(VariationalStrategy):
         # Compute full prior distribution
         full_inputs = torch.cat([inducing_points, x], dim=-2)
         full_output = self.model.forward(full_inputs, **kwargs)
-        full_covar = full_output.lazy_covariance_matrix
+        # All of the blocks below get densified anyway, so evaluate the kernel once on the full inputs
+        # (rather than once per lazily indexed block) and slice the result
+        full_covar = full_output.lazy_covariance_matrix.to_dense()
 
         # Covariance terms
         num_induc = inducing_points.size(-2)
         test_mean = full_output.mean[..., num_induc:]
-        induc_induc_covar = full_covar[..., :num_induc, :num_induc].add_jitter(self.jitter_val)
-        induc_data_covar = full_covar[..., :num_induc, num_induc:].to_dense()
+        induc_induc_covar = DenseLinearOperator(full_covar[..., :num_induc, :num_induc]).add_jitter(self.jitter_val)
+        induc_data_covar = full_covar[..., :num_induc, num_induc:]
         data_data_covar = full_covar[..., num_induc:, num_induc:]
 
         # Compute interpolation terms
@@ -213,9 +241,14 @@ class BatchDecoupledVariationalStrategy(VariationalStrategy):
             except CachingError:
                 pass
             L = self._cholesky_factor(induc_induc_covar)
-        interp_term = L.solve(induc_data_covar.double()).to(full_inputs.dtype)
-        mean_interp_term = interp_term.select(mean_var_batch_dim - 2, 0)
-        var_interp_term = interp_term.select(mean_var_batch_dim - 2, 1)
+        # L wraps a dense lower-triangular factor, so solve against it directly (skipping LinearOperator dispatch)
+        interp_term = torch.linalg.solve_triangular(
+            L.to_dense(), induc_data_covar.type(_linalg_dtype_cholesky.value()), upper=False
+        ).to(full_inputs.dtype)
+        # With a single (shared) set of inducing points, the mean and variance use the same interpolation term
+        interp_terms = interp_term.unbind(mean_var_batch_dim - 2)
+        mean_interp_term, var_interp_term = interp_terms[0], interp_terms[-1]
+        var_idx = len(interp_terms) - 1
 
         # Compute the mean of q(f)
         # k_XZ K_ZZ^{-1/2} m + \mu_X
@@ -230,10 +263,21 @@ class BatchDecoupledVariationalStrategy(VariationalStrategy):
         middle_term = self.prior_distribution.lazy_covariance_matrix.mul(-1)
         if variational_inducing_covar is not None:
             middle_term = SumLinearOperator(variational_inducing_covar, middle_term)
-        predictive_covar = SumLinearOperator(
-            data_data_covar.add_jitter(self.jitter_val).to_dense().select(mean_var_batch_dim - 2, 1),
-            MatmulLinearOperator(var_interp_term.transpose(-1, -2), middle_term @ var_interp_term),
-        )
+        # Only the variance's slice of K_XX is needed, so select it before adding the jitter
+        data_data_covar = DenseLinearOperator(data_data_covar.select(mean_var_batch_dim - 2, var_idx))
+        data_data_covar = data_data_covar.add_jitter(self.jitter_val).to_dense()
+        middle_interp_term = middle_term @ var_interp_term
+        if not self.training and data_data_covar.size(-1) <= settings.max_eager_kernel_size.value():
+            # For small test sets, form the quadratic term eagerly rather than leaving it lazy
+            # (training only needs the marginal variances, which the lazy form gives in O(n m))
+            predictive_covar = DenseLinearOperator(
+                torch.add(data_data_covar, var_interp_term.transpose(-1, -2) @ middle_interp_term)
+            )
+        else:
+            predictive_covar = SumLinearOperator(
+                data_data_covar,
+                MatmulLinearOperator(var_interp_term.transpose(-1, -2), middle_interp_term),
+            )
 
         if hasattr(self.model, 'power'):
             return MultivariateQExponential(predictive_mean, predictive_covar, power=self.model.power)
@@ -2,17 +2,27 @@
 
 import math
 import unittest
-from itertools import product
 
 import torch
 from linear_operator import to_linear_operator
 from linear_operator.operators import DenseLinearOperator, DiagLinearOperator, LinearOperator, RootLinearOperator
-from torch.distributions import MultivariateNormal as TMultivariateNormal
 
 from qpytorch.distributions import MultivariateQExponential
 from qpytorch.test import BaseTestCase
 from gpytorch.test.utils import least_used_cuda_device
 
+_skip_no_cuda = unittest.skipUnless(torch.cuda.is_available(), "CUDA unavailable")
+
+
+def _make_diag_cov(vals, device, dtype):
+    # Structured diagonal covariance, so the factorizations stay O(n) rather than a dense Cholesky
+    return DiagLinearOperator(torch.tensor(vals, device=device, dtype=dtype))
+
+
+def _diag_mvn_log_prob(mean, var, value):
+    # Log density of a Gaussian with diagonal covariance, as a sum of independent univariate terms
+    return -0.5 * (((value - mean) ** 2 / var).sum(-1) + var.log().sum(-1) + mean.size(-1) * math.log(2 * math.pi))
+
 
 class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
     seed = 1
@@ -23,7 +33,7 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
             covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
             power = torch.tensor(1., device=device, dtype=dtype)
-            qep = MultivariateQExponential(mean=mean, covariance_matrix=covmat, power=power, validate_args=True)
+            qep = MultivariateQExponential(mean=mean, covariance_matrix=covmat, power=power)
             self.assertTrue(torch.is_tensor(qep.covariance_matrix))
             self.assertIsInstance(qep.lazy_covariance_matrix, LinearOperator)
             self.assertAllClose(qep.variance, torch.diag(covmat))
@@ -48,11 +58,13 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertTrue(qep.sample().shape == torch.Size([3]))
             self.assertTrue(qep.sample(torch.Size([2])).shape == torch.Size([2, 3]))
             self.assertTrue(qep.sample(torch.Size([2, 4])).shape == torch.Size([2, 4, 3]))
+            # Argument validation is exercised once
+            MultivariateQExponential(mean=mean, covariance_matrix=covmat, power=power, validate_args=True)
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_non_lazy_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_non_lazy(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_non_lazy(cuda=True)
 
     def test_multivariate_qexponential_batch_non_lazy(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
@@ -61,12 +73,12 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
             power = torch.tensor(1.0, device=device, dtype=dtype)
             qep = MultivariateQExponential(
-                mean=mean.repeat(2, 1), covariance_matrix=covmat.repeat(2, 1, 1), power=power, validate_args=True
+                mean=mean.expand(2, -1), covariance_matrix=covmat.expand(2, -1, -1), power=power
             )
             self.assertTrue(torch.is_tensor(qep.covariance_matrix))
             self.assertIsInstance(qep.lazy_covariance_matrix, LinearOperator)
-            self.assertAllClose(qep.variance, covmat.diagonal(dim1=-1, dim2=-2).repeat(2, 1))
-            self.assertAllClose(qep.scale_tril, torch.diag(covmat.diagonal(dim1=-1, dim2=-2).sqrt()).repeat(2, 1, 1))
+            self.assertAllClose(qep.variance, covmat.diagonal(dim1=-1, dim2=-2).expand(2, -1))
+            self.assertAllClose(qep.scale_tril, torch.diag(covmat.diagonal(dim1=-1, dim2=-2).sqrt()).expand(2, -1, -1))
             qep_plus1 = qep + 1
             self.assertAllClose(qep_plus1.mean, qep.mean + 1)
             self.assertAllClose(qep_plus1.covariance_matrix, qep.covariance_matrix)
@@ -89,37 +101,44 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertTrue(qep.sample().shape == torch.Size([2, 3]))
             self.assertTrue(qep.sample(torch.Size([2])).shape == torch.Size([2, 2, 3]))
             self.assertTrue(qep.sample(torch.Size([2, 4])).shape == torch.Size([2, 4, 2, 3]))
+            # Argument validation is exercised once
+            MultivariateQExponential(
+                mean=mean.expand(2, -1), covariance_matrix=covmat.expand(2, -1, -1), power=power, validate_args=True
+            )
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_batch_non_lazy_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_batch_non_lazy(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_batch_non_lazy(cuda=True)
 
     def test_multivariate_qexponential_lazy(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
-            covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
+            covar = _make_diag_cov([1, 0.75, 1.5], device, dtype)
+            covmat = covar.to_dense()
             covmat_chol = torch.linalg.cholesky(covmat)
             power = torch.tensor(1.0, device=device, dtype=dtype)
-            qep = MultivariateQExponential(mean=mean, covariance_matrix=DenseLinearOperator(covmat), power=power)
+            qep = MultivariateQExponential(mean=mean, covariance_matrix=covar, power=power)
             self.assertTrue(torch.is_tensor(qep.covariance_matrix))
             self.assertIsInstance(qep.lazy_covariance_matrix, LinearOperator)
             self.assertAllClose(qep.variance, torch.diag(covmat))
             self.assertAllClose(qep.covariance_matrix, covmat)
-            self.assertAllClose(qep._unbroadcasted_scale_tril, covmat_chol)
+            scale_tril = qep._unbroadcasted_scale_tril
+            self.assertAllClose(scale_tril, covmat_chol)
+            # The affine transforms reuse the cached factor rather than decomposing again
             qep_plus1 = qep + 1
             self.assertAllClose(qep_plus1.mean, qep.mean + 1)
             self.assertAllClose(qep_plus1.covariance_matrix, qep.covariance_matrix)
-            self.assertAllClose(qep_plus1._unbroadcasted_scale_tril, covmat_chol)
+            self.assertTrue(torch.equal(qep_plus1._unbroadcasted_scale_tril, scale_tril))
             qep_times2 = qep * 2
             self.assertAllClose(qep_times2.mean, qep.mean * 2)
             self.assertAllClose(qep_times2.covariance_matrix, qep.covariance_matrix * 4)
-            self.assertAllClose(qep_times2._unbroadcasted_scale_tril, covmat_chol * 2)
+            self.assertTrue(torch.equal(qep_times2._unbroadcasted_scale_tril, scale_tril * 2))
             qep_divby2 = qep / 2
             self.assertAllClose(qep_divby2.mean, qep.mean / 2)
             self.assertAllClose(qep_divby2.covariance_matrix, qep.covariance_matrix / 4)
-            self.assertAllClose(qep_divby2._unbroadcasted_scale_tril, covmat_chol / 2)
+            self.assertTrue(torch.equal(qep_divby2._unbroadcasted_scale_tril, scale_tril / 2))
             # TODO: Add tests for entropy, log_prob, etc. - this an issue b/c it
             # uses using root_decomposition which is not very reliable
             # self.assertAlmostEqual(qep.entropy().item(), 4.3157, places=4)
@@ -136,35 +155,39 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertTrue(qep.sample(torch.Size([2])).shape == torch.Size([2, 3]))
             self.assertTrue(qep.sample(torch.Size([2, 4])).shape == torch.Size([2, 4, 3]))
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_lazy_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_lazy(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_lazy(cuda=True)
 
     def test_multivariate_qexponential_batch_lazy(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
-            mean = torch.tensor([0, 1, 2], device=device, dtype=dtype).repeat(2, 1)
-            covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype)).repeat(2, 1, 1)
-            covmat_chol = torch.linalg.cholesky(covmat)
+            mean = torch.tensor([0, 1, 2], device=device, dtype=dtype).expand(2, -1)
+            covar = _make_diag_cov([1, 0.75, 1.5], device, dtype).expand(2, 3, 3)
+            covmat = covar.to_dense()
+            # Every batch shares the same covariance, so the expected factor only needs one decomposition
+            covmat_chol = torch.linalg.cholesky(covmat[0]).expand(2, -1, -1)
             power = torch.tensor(1.0, device=device, dtype=dtype)
-            qep = MultivariateQExponential(mean=mean, covariance_matrix=DenseLinearOperator(covmat), power=power)
+            qep = MultivariateQExponential(mean=mean, covariance_matrix=covar, power=power)
             self.assertTrue(torch.is_tensor(qep.covariance_matrix))
             self.assertIsInstance(qep.lazy_covariance_matrix, LinearOperator)
             self.assertAllClose(qep.variance, torch.diagonal(covmat, dim1=-2, dim2=-1))
-            self.assertAllClose(qep._unbroadcasted_scale_tril, covmat_chol)
+            scale_tril = qep._unbroadcasted_scale_tril
+            self.assertAllClose(scale_tril, covmat_chol)
+            # The affine transforms reuse the cached factor rather than decomposing again
             qep_plus1 = qep + 1
             self.assertAllClose(qep_plus1.mean, qep.mean + 1)
             self.assertAllClose(qep_plus1.covariance_matrix, qep.covariance_matrix)
-            self.assertAllClose(qep_plus1._unbroadcasted_scale_tril, covmat_chol)
+            self.assertTrue(torch.equal(qep_plus1._unbroadcasted_scale_tril, scale_tril))
             qep_times2 = qep * 2
             self.assertAllClose(qep_times2.mean, qep.mean * 2)
             self.assertAllClose(qep_times2.covariance_matrix, qep.covariance_matrix * 4)
-            self.assertAllClose(qep_times2._unbroadcasted_scale_tril, covmat_chol * 2)
+            self.assertTrue(torch.equal(qep_times2._unbroadcasted_scale_tril, scale_tril * 2))
             qep_divby2 = qep / 2
             self.assertAllClose(qep_divby2.mean, qep.mean / 2)
             self.assertAllClose(qep_divby2.covariance_matrix, qep.covariance_matrix / 4)
-            self.assertAllClose(qep_divby2._unbroadcasted_scale_tril, covmat_chol / 2)
+            self.assertTrue(torch.equal(qep_divby2._unbroadcasted_scale_tril, scale_tril / 2))
             # TODO: Add tests for entropy, log_prob, etc. - this an issue b/c it
             # uses using root_decomposition which is not very reliable
             # self.assertTrue(torch.allclose(qep.entropy(), 4.3157 * torch.ones(2)))
@@ -181,46 +204,57 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertTrue(qep.sample(torch.Size([2])).shape == torch.Size([2, 2, 3]))
             self.assertTrue(qep.sample(torch.Size([2, 4])).shape == torch.Size([2, 4, 2, 3]))
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_batch_lazy_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_batch_lazy(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_batch_lazy(cuda=True)
 
     def test_multivariate_qexponential_correlated_samples(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
-            covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
+            covar = _make_diag_cov([1, 0.75, 1.5], device, dtype)
             power = torch.tensor(1.0, device=device, dtype=dtype)
-            qep = MultivariateQExponential(mean=mean, covariance_matrix=DenseLinearOperator(covmat), power=power)
+            qep = MultivariateQExponential(mean=mean, covariance_matrix=covar, power=power)
+            # Base samples are reparameterized as mean + L @ base_samples
+            scale_tril = qep.scale_tril
             base_samples = qep.get_base_samples(torch.Size([3, 4]))
-            self.assertTrue(qep.sample(base_samples=base_samples).shape == torch.Size([3, 4, 3]))
+            samples = qep.sample(base_samples=base_samples)
+            self.assertTrue(samples.shape == torch.Size([3, 4, 3]))
+            self.assertAllClose(samples, qep.mean + torch.einsum("...ij,...j->...i", scale_tril, base_samples))
             base_samples = qep.get_base_samples()
-            self.assertTrue(qep.sample(base_samples=base_samples).shape == torch.Size([3]))
+            samples = qep.sample(base_samples=base_samples)
+            self.assertTrue(samples.shape == torch.Size([3]))
+            self.assertAllClose(samples, qep.mean + torch.einsum("...ij,...j->...i", scale_tril, base_samples))
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_correlated_samples_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_correlated_samples(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_correlated_samples(cuda=True)
 
     def test_multivariate_qexponential_batch_correlated_samples(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
-            covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
+            covar = _make_diag_cov([1, 0.75, 1.5], device, dtype)
             power = torch.tensor(1.0, device=device, dtype=dtype)
             qep = MultivariateQExponential(
-                mean=mean.repeat(2, 1), covariance_matrix=DenseLinearOperator(covmat).repeat(2, 1, 1), power=power
+                mean=mean.expand(2, -1), covariance_matrix=covar.expand(2, 3, 3), power=power
             )
+            scale_tril = qep.scale_tril
             base_samples = qep.get_base_samples(torch.Size((3, 4)))
-            self.assertTrue(qep.sample(base_samples=base_samples).shape == torch.Size([3, 4, 2, 3]))
+            samples = qep.sample(base_samples=base_samples)
+            self.assertTrue(samples.shape == torch.Size([3, 4, 2, 3]))
+            self.assertAllClose(samples, qep.mean + torch.einsum("...ij,...j->...i", scale_tril, base_samples))
             base_samples = qep.get_base_samples()
-            self.assertTrue(qep.sample(base_samples=base_samples).shape == torch.Size([2, 3]))
+            samples = qep.sample(base_samples=base_samples)
+            self.assertTrue(samples.shape == torch.Size([2, 3]))
+            self.assertAllClose(samples, qep.mean + torch.einsum("...ij,...j->...i", scale_tril, base_samples))
 
+    @_skip_no_cuda
     def test_multivariate_qexponential_batch_correlated_samples_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_multivariate_qexponential_batch_correlated_samples(cuda=True)
+        with least_used_cuda_device():
+            self.test_multivariate_qexponential_batch_correlated_samples(cuda=True)
 
     def test_log_prob(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
@@ -230,7 +264,7 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             values = torch.randn(4, device=device, dtype=dtype)
 
             res = MultivariateQExponential(mean, DiagLinearOperator(var)).log_prob(values)
-            actual = TMultivariateNormal(mean, torch.eye(4, device=device, dtype=dtype) * var).log_prob(values)
+            actual = _diag_mvn_log_prob(mean, var, values)
             self.assertLess((res - actual).div(res).abs().item(), 1e-2)
 
             mean = torch.randn(3, 4, device=device, dtype=dtype)
@@ -238,28 +272,26 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             values = torch.randn(3, 4, device=device, dtype=dtype)
 
             res = MultivariateQExponential(mean, DiagLinearOperator(var)).log_prob(values)
-            actual = TMultivariateNormal(
-                mean, var.unsqueeze(-1) * torch.eye(4, device=device, dtype=dtype).repeat(3, 1, 1)
-            ).log_prob(values)
+            actual = _diag_mvn_log_prob(mean, var, values)
             self.assertLess((res - actual).div(res).abs().norm(), 1e-2)
 
+    @_skip_no_cuda
     def test_log_prob_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_log_prob(cuda=True)
+        with least_used_cuda_device():
+            self.test_log_prob(cuda=True)
 
     def test_kl_divergence(self, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
         for dtype in (torch.float, torch.double):
-            mean0 = torch.randn(4, device=device, dtype=dtype)
+            rand = torch.randn(2, 4, device=device, dtype=dtype)
+            mean0, var0 = rand[0], rand[1].abs_()
             mean1 = mean0 + 1
-            var0 = torch.randn(4, device=device, dtype=dtype).abs_()
-            var1 = var0 * math.exp(2)
             power = torch.tensor(1.0, device=device, dtype=dtype)
 
-            dist_a = MultivariateQExponential(mean0, DiagLinearOperator(var0), power)
-            dist_b = MultivariateQExponential(mean1, DiagLinearOperator(var0), power)
-            dist_c = MultivariateQExponential(mean0, DiagLinearOperator(var1), power)
+            covars = DiagLinearOperator(torch.stack([var0, var0 * math.exp(2)]))
+            dist_a = MultivariateQExponential(mean0, covars[0], power)
+            dist_b = MultivariateQExponential(mean1, covars[0], power)
+            dist_c = MultivariateQExponential(mean0, covars[1], power)
 
             res = torch.distributions.kl.kl_divergence(dist_a, dist_a)
             actual = 0.0
@@ -277,15 +309,17 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             actual = 0.5 * (8 - 4 + 4 * math.exp(-2))
             self.assertLess((res - actual).div(res).abs().item(), 1e-2)
 
+    @_skip_no_cuda
     def test_kl_divergence_cuda(self):
-        if torch.cuda.is_available():
-            with least_used_cuda_device():
-                self.test_kl_divergence(cuda=True)
+        with least_used_cuda_device():
+            self.test_kl_divergence(cuda=True)
 
     def test_getitem(self):
         shape = (2, 4, 3, 2)
         cov = torch.randn(*shape, shape[1])
-        cov = cov @ cov.transpose(-1, -2)
+        # Form the PSD covariances with one batched matmul over the flattened batch dimensions
+        flat = cov.reshape(-1, shape[-1], shape[1])
+        cov = torch.bmm(flat, flat.transpose(-1, -2)).view(*shape, shape[-1])
         mean = torch.randn(*shape)
         power = torch.tensor(1.0)
         dist = MultivariateQExponential(mean, cov, power)
@@ -298,7 +332,7 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
         d = dist[..., 1]
         assert torch.equal(d.mean, dist.mean[..., 1])
         cov = dist_cov[..., 1, 1]
-        self.assertAllClose(d.covariance_matrix, cov.unsqueeze(-1) * torch.eye(shape[-2]))
+        self.assertAllClose(d.covariance_matrix, torch.diag_embed(cov))
 
         d = dist[:, [2, 3], :, 1:]
         assert torch.equal(d.mean, dist.mean[:, [2, 3], :, 1:])
@@ -323,8 +357,11 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
         dist = MultivariateQExponential(torch.zeros(5), lazy_square_a, power)
 
         # check that providing the base samples is okay
-        samples = dist.rsample(torch.Size((16,)), base_samples=torch.randn(16, 10))
+        base_samples = torch.randn(16, 10)
+        samples = dist.rsample(torch.Size((16,)), base_samples=base_samples)
         self.assertEqual(samples.shape, torch.Size((16, 5)))
+        # the root of the covariance is used as is
+        self.assertAllClose(samples, base_samples @ a.transpose(-1, -2))
 
         # check that an event shape of base samples fails
         self.assertRaises(RuntimeError, dist.rsample, torch.Size((16,)), base_samples=torch.randn(16, 5))
@@ -334,12 +371,15 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
         nonlazy_square_a = to_linear_operator(lazy_square_a.to_dense())
         dist = MultivariateQExponential(torch.zeros(5), nonlazy_square_a, power)
 
-        samples = dist.rsample(torch.Size((16,)), base_samples=torch.randn(16, 5))
+        scale_tril = dist.scale_tril
+        base_samples = torch.randn(16, 5)
+        samples = dist.rsample(torch.Size((16,)), base_samples=base_samples)
         self.assertEqual(samples.shape, torch.Size((16, 5)))
+        self.assertAllClose(samples, base_samples @ scale_tril.transpose(-1, -2), rtol=1e-3, atol=1e-3)
 
-    def test_multivariate_qexponential_expand(self, cuda=False):
+    def _test_multivariate_qexponential_expand(self, lazy, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
-        for dtype, lazy in product((torch.float, torch.double), (True, False)):
+        for dtype in (torch.float, torch.double):
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype)
             covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype))
             power = torch.tensor(1.0, device=device, dtype=dtype)
@@ -353,6 +393,8 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertEqual(qep.islazy, lazy)
             expanded = qep.expand(torch.Size([2]))
             self.assertIsInstance(expanded, MultivariateQExponential)
+            # The derived distribution keeps the validation setting of its parent
+            self.assertEqual(expanded._validate_args, qep._validate_args)
             self.assertEqual(expanded.islazy, lazy)
             self.assertEqual(expanded.batch_shape, torch.Size([2]))
             self.assertEqual(expanded.event_shape, qep.event_shape)
@@ -363,9 +405,15 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             self.assertTrue(torch.allclose(expanded.scale_tril, qep.scale_tril.expand(2, -1, -1)))
             self.assertEqual(expanded.scale_tril.shape, torch.Size([2, 3, 3]))
 
-    def test_multivariate_normal_unsqueeze(self, cuda=False):
+    def test_multivariate_qexponential_expand_lazy(self):
+        self._test_multivariate_qexponential_expand(lazy=True)
+
+    def test_multivariate_qexponential_expand_non_lazy(self):
+        self._test_multivariate_qexponential_expand(lazy=False)
+
+    def _test_multivariate_normal_unsqueeze(self, lazy, cuda=False):
         device = torch.device("cuda") if cuda else torch.device("cpu")
-        for dtype, lazy in product((torch.float, torch.double), (True, False)):
+        for dtype in (torch.float, torch.double):
             batch_shape = torch.Size([2, 3])
             mean = torch.tensor([0, 1, 2], device=device, dtype=dtype).expand(*batch_shape, -1)
             covmat = torch.diag(torch.tensor([1, 0.75, 1.5], device=device, dtype=dtype)).expand(*batch_shape, -1, -1)
@@ -381,6 +429,7 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
             for dim, positive_dim, expected_batch in ((1, 1, torch.Size([2, 1, 3])), (-1, 2, torch.Size([2, 3, 1]))):
                 new = qep.unsqueeze(dim)
                 self.assertIsInstance(new, MultivariateQExponential)
+                self.assertEqual(new._validate_args, qep._validate_args)
                 self.assertEqual(new.islazy, lazy)
                 self.assertEqual(new.batch_shape, expected_batch)
                 self.assertEqual(new.event_shape, qep.event_shape)
@@ -400,5 +449,12 @@ class TestMultivariateQExponential(BaseTestCase, unittest.TestCase):
         qep.unsqueeze(2)
         qep.unsqueeze(-3)
 
+    def test_multivariate_normal_unsqueeze_lazy(self):
+        self._test_multivariate_normal_unsqueeze(lazy=True)
+
+    def test_multivariate_normal_unsqueeze_non_lazy(self):
+        self._test_multivariate_normal_unsqueeze(lazy=False)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import copy
 import os
 import random
 import unittest
@@ -28,6 +29,10 @@ y2_inds_test = torch.ones(51, dtype=torch.long)
 test_y1 = torch.sin(test_x * (2 * pi))
 test_y2 = torch.cos(test_x * (2 * pi))
 
+full_x = torch.cat([train_x, train_x])
+full_i = torch.cat([y1_inds, y2_inds])
+full_y = torch.cat([train_y1, train_y2])
+
 POWER = 1.0
 
 class HadamardMultitaskQEPModel(qpytorch.models.ExactQEP):
@@ -55,6 +60,16 @@ class HadamardMultitaskQEPModel(qpytorch.models.ExactQEP):
 
 
 class TestHadamardMultitaskQEPRegression(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the model once and restore its initial parameters before each test
+        with torch.random.fork_rng():
+            if os.getenv("UNLOCK_SEED") is None or os.getenv("UNLOCK_SEED").lower() == "false":
+                torch.manual_seed(0)
+            cls._likelihood = QExponentialLikelihood(noise_prior=SmoothedBoxPrior(-6, 6), power=torch.tensor(POWER))
+            cls._model = HadamardMultitaskQEPModel((full_x, full_i), full_y, cls._likelihood)
+        cls._initial_state = copy.deepcopy(cls._model.state_dict())
+
     def setUp(self):
         if os.getenv("UNLOCK_SEED") is None or os.getenv("UNLOCK_SEED").lower() == "false":
             self.rng_state = torch.get_rng_state()
@@ -62,16 +77,17 @@ class TestHadamardMultitaskQEPRegression(unittest.TestCase):
             if torch.cuda.is_available():
                 torch.cuda.manual_seed_all(0)
             random.seed(0)
+        self.likelihood = self._likelihood
+        self.model = self._model
+        self.model.load_state_dict(self._initial_state)
 
     def tearDown(self):
         if hasattr(self, "rng_state"):
             torch.set_rng_state(self.rng_state)
 
     def test_multitask_qep_mean_abs_error(self):
-        likelihood = QExponentialLikelihood(noise_prior=SmoothedBoxPrior(-6, 6), power=torch.tensor(POWER))
-        qep_model = HadamardMultitaskQEPModel(
-            (torch.cat([train_x, train_x]), torch.cat([y1_inds, y2_inds])), torch.cat([train_y1, train_y2]), likelihood
-        )
+        likelihood = self.likelihood
+        qep_model = self.model
         mll = qpytorch.mlls.ExactMarginalLogLikelihood(likelihood, qep_model)
 
         # Optimize the model
@@ -80,8 +96,8 @@ class TestHadamardMultitaskQEPRegression(unittest.TestCase):
         optimizer = optim.Adam(qep_model.parameters(), lr=0.01)
         for _ in range(100):
             optimizer.zero_grad()
-            output = qep_model(torch.cat([train_x, train_x]), torch.cat([y1_inds, y2_inds]))
-            loss = -mll(output, torch.cat([train_y1, train_y2]))
+            output = qep_model(full_x, full_i)
+            loss = -mll(output, full_y)
             loss.backward()
             optimizer.step()
 
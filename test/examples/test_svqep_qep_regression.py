@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
+import functools
 import math
 import unittest
 import warnings
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import linear_operator
 import torch
@@ -18,8 +19,14 @@ from gpytorch.test.utils import least_used_cuda_device
 from qpytorch.utils.warnings import OldVersionWarning
 
 POWER = 1.99
+# Shared across models: the power is only read and the strategy clones the inducing points
+_POWER = torch.tensor(POWER)
+_INDUCING_POINTS = torch.linspace(0, 1, 25)
 
+
+@functools.lru_cache(maxsize=4)
 def train_data(cuda=False):
+    # The tests only read the data, so the tensors are shared between them
     train_x = torch.linspace(0, 1, 260)
     train_y = torch.cos(train_x * (2 * math.pi))
     if cuda:
@@ -30,7 +37,7 @@ def train_data(cuda=False):
 
 class SVQEPRegressionModel(ApproximateQEP):
     def __init__(self, inducing_points, distribution_cls):
-        self.power = torch.tensor(POWER)
+        self.power = _POWER
         variational_distribution = distribution_cls(inducing_points.size(-1), power=self.power)
         variational_strategy = qpytorch.variational.VariationalStrategy(
             self, inducing_points, variational_distribution, learn_inducing_locations=True, jitter_val=1e-4
@@ -51,8 +58,8 @@ class TestSVQEPRegression(BaseTestCase, unittest.TestCase):
 
     def test_loading_old_model(self):
         train_x, train_y = train_data(cuda=False)
-        likelihood = QExponentialLikelihood(power=torch.tensor(POWER))
-        model = SVQEPRegressionModel(torch.linspace(0, 1, 25), qpytorch.variational.CholeskyVariationalDistribution)
+        likelihood = QExponentialLikelihood(power=_POWER)
+        model = SVQEPRegressionModel(_INDUCING_POINTS, qpytorch.variational.CholeskyVariationalDistribution)
         data_file = Path(__file__).parent.joinpath("old_variational_strategy_model.pth").resolve()
         state_dicts = torch.load(data_file)
         likelihood.load_state_dict(state_dicts["likelihood"], strict=False)
@@ -78,8 +85,8 @@ class TestSVQEPRegression(BaseTestCase, unittest.TestCase):
         distribution_cls=qpytorch.variational.CholeskyVariationalDistribution,
     ):
         train_x, train_y = train_data(cuda=cuda)
-        likelihood = QExponentialLikelihood(power=torch.tensor(POWER))
-        model = SVQEPRegressionModel(torch.linspace(0, 1, 25), distribution_cls)
+        likelihood = QExponentialLikelihood(power=_POWER)
+        model = SVQEPRegressionModel(_INDUCING_POINTS, distribution_cls)
         mll = mll_cls(likelihood, model, num_data=len(train_y))
         if cuda:
             likelihood = likelihood.cuda()
@@ -91,9 +98,15 @@ class TestSVQEPRegression(BaseTestCase, unittest.TestCase):
         likelihood.train()
         optimizer = optim.Adam([{"params": model.parameters()}, {"params": likelihood.parameters()}], lr=0.01)
 
-        _wrapped_cg = MagicMock(wraps=linear_operator.utils.linear_cg)
-        _cg_mock = patch("linear_operator.utils.linear_cg", new=_wrapped_cg)
-        with _cg_mock as cg_mock:
+        # Only whether CG runs matters, so a plain flag is enough (no need to record every call)
+        cg_called = [False]
+        linear_cg = linear_operator.utils.linear_cg
+
+        def _cg_probe(*args, **kwargs):
+            cg_called[0] = True
+            return linear_cg(*args, **kwargs)
+
+        with patch("linear_operator.utils.linear_cg", new=_cg_probe):
             for _ in range(250):
                 optimizer.zero_grad()
                 output = model(train_x)
@@ -101,12 +114,11 @@ class TestSVQEPRegression(BaseTestCase, unittest.TestCase):
                 loss.backward()
                 optimizer.step()
 
-            for param in model.parameters():
-                self.assertTrue(param.grad is not None)
-                self.assertGreater(param.grad.norm().item(), 0)
-            for param in likelihood.parameters():
-                self.assertTrue(param.grad is not None)
-                self.assertGreater(param.grad.norm().item(), 0)
+            # Check all of the gradients with a single fused norm and one device sync
+            grads = [param.grad for param in (*model.parameters(), *likelihood.parameters())]
+            self.assertTrue(all(grad is not None for grad in grads))
+            for grad_norm in torch.stack(torch._foreach_norm(grads)).tolist():
+                self.assertGreater(grad_norm, 0)
 
             # Set back to eval mode
             model.eval()
@@ -116,7 +128,7 @@ class TestSVQEPRegression(BaseTestCase, unittest.TestCase):
             self.assertLess(mean_abs_error.item(), 0.20)
 
             # Make sure CG was called (or not), and no warnings were thrown
-            self.assertFalse(cg_mock.called)
+            self.assertFalse(cg_called[0])
 
             if distribution_cls is qpytorch.variational.CholeskyVariationalDistribution:
                 # finally test fantasization
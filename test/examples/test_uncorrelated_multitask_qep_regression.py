@@ -75,9 +75,11 @@ class TestIndependentMultitaskQEPRegression(unittest.TestCase):
             loss.backward()
             optimizer.step()
 
-            for param in qep_model.parameters():
-                self.assertTrue(param.grad is not None)
-                self.assertGreater(param.grad.norm().item(), 0)
+        # Check all of the gradients with a single fused norm and one device sync
+        grads = [param.grad for param in qep_model.parameters()]
+        self.assertTrue(all(grad is not None for grad in grads))
+        for grad_norm in torch.stack(torch._foreach_norm(grads)).tolist():
+            self.assertGreater(grad_norm, 0)
 
         # Test the model
         qep_model.eval()
@@ -86,8 +88,9 @@ class TestIndependentMultitaskQEPRegression(unittest.TestCase):
         # Make predictions for both sets of test points, and check MAEs.
         with torch.no_grad(), qpytorch.settings.max_eager_kernel_size(1):
             batch_predictions = likelihood(qep_model(test_x))
-            preds1 = batch_predictions.mean[:, 0]
-            preds2 = batch_predictions.mean[:, 1]
+            preds = batch_predictions.mean
+            preds1 = preds[:, 0]
+            preds2 = preds[:, 1]
             mean_abs_error1 = torch.mean(torch.abs(test_y1 - preds1))
             mean_abs_error2 = torch.mean(torch.abs(test_y2 - preds2))
             self.assertLess(mean_abs_error1.squeeze().item(), 0.01)
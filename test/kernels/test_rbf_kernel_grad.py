@@ -60,6 +60,44 @@ class TestRBFKernelGrad(unittest.TestCase, BaseKernelTestCase):
 
         self.assertLess(torch.norm(res - actual), 1e-5)
 
+    def test_kernel_ard_batch(self):
+        a = torch.randn(2, 3, 2, dtype=torch.double)
+        b = torch.randn(2, 4, 2, dtype=torch.double)
+        ls = torch.tensor([[[0.5, 1.5]], [[2.0, 0.8]]], dtype=torch.double)
+
+        kernel = RBFKernelGrad(ard_num_dims=2, batch_shape=torch.Size([2])).double()
+        kernel.initialize(lengthscale=ls)
+        res = kernel(a, b).to_dense().view(2, 3, 3, 4, 3)
+
+        # Compare each block against the derivatives of the RBF kernel computed by autograd
+        def rbf(x1, x2, lengthscale):
+            return torch.exp(-0.5 * ((x1 - x2) / lengthscale).pow(2).sum())
+
+        d_x1 = torch.func.grad(rbf, argnums=0)
+        d_x2 = torch.func.grad(rbf, argnums=1)
+        d_x1_x2 = torch.func.jacrev(d_x1, argnums=1)
+        actual = torch.zeros_like(res)
+        for k in range(2):
+            for i in range(3):
+                for j in range(4):
+                    x1, x2, lengthscale = a[k, i], b[k, j], ls[k, 0]
+                    actual[k, i, 0, j, 0] = rbf(x1, x2, lengthscale)
+                    actual[k, i, 0, j, 1:] = d_x2(x1, x2, lengthscale)
+                    actual[k, i, 1:, j, 0] = d_x1(x1, x2, lengthscale)
+                    actual[k, i, 1:, j, 1:] = d_x1_x2(x1, x2, lengthscale)
+
+        self.assertLess(torch.norm(res - actual), 1e-10)
+
+    def test_kernel_symmetric(self):
+        a = torch.randn(2, 10, 3) * 3
+        kernel = RBFKernelGrad(ard_num_dims=3, batch_shape=torch.Size([2]))
+        kernel.initialize(lengthscale=torch.rand(2, 1, 3) + 0.3)
+
+        res = kernel(a).to_dense()
+        self.assertTrue(torch.equal(res, res.transpose(-1, -2)))
+        res = kernel(a, a.clone()).to_dense()
+        self.assertTrue(torch.equal(res, res.transpose(-1, -2)))
+
     def test_initialize_lengthscale(self):
         kernel = RBFKernelGrad()
         kernel.initialize(lengthscale=3.14)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import unittest
+from unittest.mock import patch
 
 import torch
 
@@ -203,6 +204,35 @@ class TestInterpolatedExactQEP(TestExactQEP):
         model = InterpolatedExactQEPModel(train_x, train_y, likelihood)
         return model
 
+    def test_interp_weights_cached(self):
+        train_x = self.create_test_data()
+        likelihood, labels = self.create_likelihood_and_labels()
+        model = self.create_model(train_x, labels, likelihood)
+        mll = ExactMarginalLogLikelihood(likelihood, model)
+        model.train()
+
+        covar_module = model.covar_module
+        with patch.object(covar_module, "_compute_grid", wraps=covar_module._compute_grid) as compute_grid:
+            losses = [-mll(model(train_x), labels) for _ in range(2)]
+        # The interpolation weights of the training inputs are only computed on the first pass
+        self.assertEqual(compute_grid.call_count, 1)
+        self.assertTrue(torch.equal(losses[0], losses[1]))
+
+    def test_interp_weights_inference_mode(self):
+        train_x = self.create_test_data()
+        likelihood, labels = self.create_likelihood_and_labels()
+        model = self.create_model(train_x, labels, likelihood)
+        test_x = self.create_test_data()
+        model.eval()
+        with torch.no_grad():
+            expected = model(test_x).mean
+        # Inference tensors have no version counter, so predictions under inference_mode bypass the cache
+        with torch.inference_mode():
+            output = model(test_x).mean
+        self.assertTrue(torch.allclose(output, expected))
+        # Only training inputs are cached, so the module holds no reference to the eval inputs
+        self.assertIsNone(getattr(model.covar_module, "_cached_interp", None))
+
 
 class TestWiskiExactQEP(TestInterpolatedExactQEP):
     def create_model(self, train_x, train_y, likelihood):
@@ -3,8 +3,10 @@
 import unittest
 
 import torch
+from linear_operator.operators import DenseLinearOperator, SumLinearOperator
 
 import qpytorch
+from gpytorch.utils.memoize import pop_from_cache_ignore_args
 from qpytorch.test.variational_test_case import VariationalTestCase
 
 POWER = 1.0
@@ -60,6 +62,44 @@ class TestBatchDecoupledVariational(VariationalTestCase, unittest.TestCase):
         self.assertEqual(cholesky_mock.call_count, 1)  # One to compute cache, that's it!
         self.assertFalse(ciq_mock.called)
 
+    def test_linalg_dtype_cholesky(self):
+        model, _ = self._make_model_and_likelihood(
+            batch_shape=self.batch_shape,
+            inducing_batch_shape=self.batch_shape,
+            strategy_cls=self.strategy_cls,
+            distribution_cls=self.distribution_cls,
+        )
+        model.eval()
+        test_x = torch.randn(*self.batch_shape, 5, 2)
+        output = model(test_x)
+        # The interpolation term is solved in the Cholesky dtype; float32 avoids the upcast to float64
+        with qpytorch.settings.linalg_dtypes(default=torch.float, cholesky=torch.float):
+            pop_from_cache_ignore_args(model.variational_strategy, "cholesky_factor")
+            single_output = model(test_x)
+        self.assertEqual(single_output.mean.dtype, torch.float)
+        self.assertAllClose(output.mean, single_output.mean, rtol=1e-3, atol=1e-4)
+        self.assertAllClose(output.variance, single_output.variance, rtol=1e-3, atol=1e-4)
+
+    def test_lazy_predictive_covar(self):
+        model, _ = self._make_model_and_likelihood(
+            batch_shape=self.batch_shape,
+            inducing_batch_shape=self.batch_shape,
+            strategy_cls=self.strategy_cls,
+            distribution_cls=self.distribution_cls,
+        )
+        model.eval()
+        test_x = torch.randn(*self.batch_shape, 5, 2)
+        output = model(test_x)
+        # Test sets larger than max_eager_kernel_size keep the quadratic term of the covariance lazy
+        with qpytorch.settings.max_eager_kernel_size(1):
+            lazy_output = model(test_x)
+        self.assertAllClose(output.covariance_matrix, lazy_output.covariance_matrix)
+        self.assertIsInstance(output.lazy_covariance_matrix, DenseLinearOperator)
+        self.assertIsInstance(lazy_output.lazy_covariance_matrix, SumLinearOperator)
+        # Training batches keep the lazy form as well
+        model.train()
+        self.assertIsInstance(model(test_x).lazy_covariance_matrix, SumLinearOperator)
+
     def test_fantasy_call(self, *args, **kwargs):
         # with self.assertRaises(AttributeError):
         #     super().test_fantasy_call(*args, **kwargs)
@@ -96,6 +136,48 @@ class TestMeanFieldBatchDecoupledRobust(TestBatchDecoupledRobust):
         return qpytorch.variational.MeanFieldVariationalDistribution
 
 
+class TestBatchDecoupledVariationalFixedInducing(TestBatchDecoupledVariational):
+    @property
+    def strategy_cls(self):
+        def _fixed_strategy_cls(model, inducing_points, variational_distribution, learn_inducing_locations):
+            return qpytorch.variational.BatchDecoupledVariationalStrategy(
+                model, inducing_points, variational_distribution, learn_inducing_locations=False
+            )
+
+        return _fixed_strategy_cls
+
+    def test_shared_inducing_points(self):
+        torch.manual_seed(0)
+        model, _ = self._make_model_and_likelihood(strategy_cls=self.strategy_cls)
+        torch.manual_seed(0)
+        stacked_model, _ = self._make_model_and_likelihood(strategy_cls=strategy_cls)
+        # A single set of inducing points is kept when they are shared between the mean and variance
+        self.assertEqual(model.variational_strategy.inducing_points.shape, torch.Size([1, 16, 2]))
+        self.assertEqual(stacked_model.variational_strategy.inducing_points.shape, torch.Size([2, 16, 2]))
+
+        test_x = torch.randn(5, 2)
+        torch.manual_seed(1)
+        output = model(test_x)
+        torch.manual_seed(1)
+        stacked_output = stacked_model(test_x)
+        self.assertAllClose(output.mean, stacked_output.mean)
+        self.assertAllClose(output.covariance_matrix, stacked_output.covariance_matrix)
+
+    def test_load_stacked_inducing_points(self):
+        model, _ = self._make_model_and_likelihood(strategy_cls=self.strategy_cls)
+        # Models saved before the inducing points were shared hold two stacked copies
+        state_dict = model.state_dict()
+        inducing_points = torch.randn(16, 2)
+        state_dict["variational_strategy.inducing_points"] = torch.stack([inducing_points, inducing_points])
+        model.load_state_dict(state_dict)
+        self.assertEqual(model.variational_strategy.inducing_points, inducing_points.unsqueeze(0))
+
+        # Separately learned mean/variance inducing points cannot be collapsed into a single set
+        state_dict["variational_strategy.inducing_points"] = torch.randn(2, 16, 2)
+        with self.assertRaisesRegex(RuntimeError, "size mismatch"):
+            model.load_state_dict(state_dict)
+
+
 class TestBatchDecoupledVariationalBatchDim(TestBatchDecoupledVariational, unittest.TestCase):
     def _make_model_and_likelihood(
         self,
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import functools
 import unittest
 
 import torch
@@ -9,31 +10,31 @@ from qpytorch.test.variational_test_case import VariationalTestCase
 
 POWER = 1.0
 
-def multitask_likelihood_cls():
-    return qpytorch.likelihoods.MultitaskGaussianLikelihood(num_tasks=2) if POWER==2 \
-           else qpytorch.likelihoods.MultitaskQExponentialLikelihood(num_tasks=2, power=torch.tensor(POWER))
-
-
-def singletask_likelihood_cls():
-    return qpytorch.likelihoods.GaussianLikelihood() if POWER==2 \
-           else qpytorch.likelihoods.QExponentialLikelihood(power=torch.tensor(POWER))
+# POWER is fixed at import, so the likelihood factories are selected once here rather than on every call
+if POWER == 2:
+    multitask_likelihood_cls = functools.partial(qpytorch.likelihoods.MultitaskGaussianLikelihood, num_tasks=2)
+    singletask_likelihood_cls = qpytorch.likelihoods.GaussianLikelihood
+else:
+    _POWER_TENSOR = torch.tensor(POWER)
+    multitask_likelihood_cls = functools.partial(
+        qpytorch.likelihoods.MultitaskQExponentialLikelihood, num_tasks=2, power=_POWER_TENSOR
+    )
+    singletask_likelihood_cls = functools.partial(qpytorch.likelihoods.QExponentialLikelihood, power=_POWER_TENSOR)
 
 
 def strategy_cls(model, inducing_points, variational_distribution, learn_inducing_locations):
-    if POWER==2:
-        return qpytorch.variational.IndependentMultitaskVariationalStrategy(
-            qpytorch.variational.VariationalStrategy(
-                model, inducing_points, variational_distribution, learn_inducing_locations
-            ),
-            num_tasks=2,
-        )
-    else:
-        return qpytorch.variational.UncorrelatedMultitaskVariationalStrategy(
-            qpytorch.variational.VariationalStrategy(
-                model, inducing_points, variational_distribution, learn_inducing_locations
-            ),
-            num_tasks=2,
-        )
+    # Only the multitask wrapper depends on POWER
+    wrapper_cls = (
+        qpytorch.variational.IndependentMultitaskVariationalStrategy
+        if POWER == 2
+        else qpytorch.variational.UncorrelatedMultitaskVariationalStrategy
+    )
+    return wrapper_cls(
+        qpytorch.variational.VariationalStrategy(
+            model, inducing_points, variational_distribution, learn_inducing_locations
+        ),
+        num_tasks=2,
+    )
 
 
 class TestMultitaskVariational(VariationalTestCase, unittest.TestCase):
@@ -126,22 +127,38 @@ class TestDeltaMultitaskRobust(TestMultitaskRobust):
 
 
 class TestIndexedMultitaskVariational(TestMultitaskVariational, unittest.TestCase):
+    # Inputs and task indices, shared by every indexed test (keyed by batch shape, train/eval and device)
+    _FIXTURE_CACHE = {}
+
+    @classmethod
+    def _make_fixtures(cls, batch_shape, train=True, cuda=False):
+        key = (tuple(batch_shape), train, cuda)
+        if key not in cls._FIXTURE_CACHE:
+            if cuda:
+                fixtures = tuple(t.cuda() for t in cls._make_fixtures(batch_shape, train=train))
+            else:
+                # Evaluation uses its own draw, so that it runs on points unseen in training
+                generator = torch.Generator().manual_seed(0 if train else 1)
+                x = torch.randn(*batch_shape, 32, 2, generator=generator).clamp(-2.5, 2.5)
+                # Alternate the two tasks so that neither task is ever left without observations
+                i = (torch.arange(32) % 2).expand(*batch_shape, 32)
+                fixtures = (x, i)
+            cls._FIXTURE_CACHE[key] = fixtures
+        return cls._FIXTURE_CACHE[key]
+
     def _training_iter(
         self, model, likelihood, batch_shape=torch.Size([]), mll_cls=qpytorch.mlls.VariationalELBO, cuda=False
     ):
         batch_shape = list(batch_shape)
         batch_shape[-1] = 1
-        train_x = torch.randn(*batch_shape, 32, 2).clamp(-2.5, 2.5)
-        train_i = torch.rand(*batch_shape, 32).round().long()
-        train_y = torch.linspace(-1, 1, self.event_shape[0])
-        train_y = train_y.view(self.event_shape[0], *([1] * (len(self.event_shape) - 1)))
-        train_y = train_y.expand(*self.event_shape)
+        train_x, train_i = self._make_fixtures(batch_shape, cuda=cuda)
+        # The indexed event shape is one-dimensional, so the targets need no reshaping
+        train_y = torch.linspace(-1, 1, self.event_shape[0], device=train_x.device)
         mll = mll_cls(likelihood, model, num_data=train_x.size(-2))
-        if cuda:
-            train_x = train_x.cuda()
-            train_i = train_i.cuda()
-            train_y = train_y.cuda()
+        # The model and likelihood persist across iterations, so they only need to be moved the first time
+        if cuda and not next(model.parameters()).is_cuda:
             model = model.cuda()
+        if cuda and not next(likelihood.parameters()).is_cuda:
             likelihood = likelihood.cuda()
 
         # Single optimization iteration
@@ -149,31 +166,31 @@ class TestIndexedMultitaskVariational(TestMultitaskVariational, unittest.TestCas
         likelihood.train()
         output = model(train_x, task_indices=train_i)
         loss = -mll(output, train_y)
-        loss.sum().backward()
+        (loss if loss.dim() == 0 else loss.sum()).backward()
 
         # Make sure we have gradients for all parameters
-        for _, param in model.named_parameters():
-            self.assertTrue(param.grad is not None)
-            self.assertGreater(param.grad.norm().item(), 0)
-        for _, param in likelihood.named_parameters():
-            self.assertTrue(param.grad is not None)
-            self.assertGreater(param.grad.norm().item(), 0)
+        self._assert_all_grads_nonzero(model)
+        self._assert_all_grads_nonzero(likelihood)
 
         return output, loss
 
+    def _assert_all_grads_nonzero(self, module):
+        grads = [param.grad for param in module.parameters()]
+        self.assertTrue(all(grad is not None for grad in grads))
+        # Each gradient needs a non-zero entry and no NaN/inf values; the flags are read back with a single device sync
+        for valid in torch.stack([grad.ne(0).any() & grad.isfinite().all() for grad in grads]).tolist():
+            self.assertTrue(valid)
+
     def _eval_iter(self, model, batch_shape=torch.Size([]), cuda=False):
         batch_shape = list(batch_shape)
         batch_shape[-1] = 1
-        test_x = torch.randn(*batch_shape, 32, 2).clamp(-2.5, 2.5)
-        test_i = torch.rand(*batch_shape, 32).round().long()
-        if cuda:
-            test_x = test_x.cuda()
-            test_i = test_i.cuda()
+        test_x, test_i = self._make_fixtures(batch_shape, train=False, cuda=cuda)
+        if cuda and not next(model.parameters()).is_cuda:
             model = model.cuda()
 
         # Single optimization iteration
         model.eval()
-        with torch.no_grad():
+        with torch.inference_mode():
             output = model(test_x, task_indices=test_i)
 
         return output